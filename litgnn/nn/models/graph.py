@@ -20,12 +20,15 @@ class GraphLevelGNN(nn.Module):
         num_ffn_layers: int = 1,
         dropout: float = 0.0,
         pooling_func_name: str = "global_mean_pool",
+        inference_dtype: str = "float32",
         **model_kwargs
     ) -> None:
 
         super().__init__()
         assert hasattr(global_pooling, pooling_func_name), "Invalid pooling function!"
         self.pooling = getattr(global_pooling, pooling_func_name)
+        assert inference_dtype in ("float32", "bfloat16", "float16"), "Invalid inference dtype!"
+        self.inference_dtype = getattr(torch, inference_dtype)
 
         assert hasattr(models, model_cls), f"Model class '{model_cls}' not found!"
         self.model = getattr(models, model_cls)(
@@ -43,7 +46,7 @@ class GraphLevelGNN(nn.Module):
                 ffns.extend([
                     nn.Dropout(p=dropout),
                     nn.Linear(hidden_channels, hidden_channels),
-                    nn.ReLU(),
+                    nn.ReLU(inplace=True),
                 ])
         ffns.extend([nn.Dropout(p=dropout), nn.Linear(hidden_channels, out_channels)])
         self.seq_out = nn.Sequential(*ffns)
@@ -57,6 +60,36 @@ class GraphLevelGNN(nn.Module):
             if module.bias is not None:
                 torch.nn.init.constant_(module.bias, 0)
 
+    def quantize_for_cpu(self) -> nn.Module:
+        """Returns a copy of the model with all `nn.Linear` layers dynamically quantized to int8.
+
+        Recurrent layers are not quantized. The copy always runs `predict` in fp32 since the
+        quantized kernels expect fp32 inputs. Intended for CPU inference only.
+        """
+        quantized = torch.ao.quantization.quantize_dynamic(self, {nn.Linear}, dtype=torch.qint8)
+        quantized.inference_dtype = torch.float32
+        return quantized
+
+    @torch.no_grad()
+    def predict(
+        self,
+        x: Tensor,
+        edge_index: Adj,
+        edge_attr: Tensor,
+        batch: Tensor
+    ) -> Tensor:
+        """Runs the forward pass under autocast with `inference_dtype` and returns fp32 outputs.
+
+        Only meant for inference; training, validation and testing go through `forward` in fp32.
+        Note that CUDA autocast also runs recurrent ops (e.g. `nn.GRU`, `nn.GRUCell`) in reduced precision.
+        """
+        assert not (self.inference_dtype == torch.float16 and x.device.type == "cpu"), \
+            "float16 autocast is not supported on CPU! Please use bfloat16 instead."
+        enabled = self.inference_dtype != torch.float32
+        with torch.autocast(device_type=x.device.type, dtype=self.inference_dtype, enabled=enabled):
+            out = self(x=x, edge_index=edge_index, edge_attr=edge_attr, batch=batch)
+        return out.float()
+
     def forward(
         self,
         x: Tensor,
@@ -67,6 +67,16 @@ class LitGNNModel(L.LightningModule):
 
         self._log_and_reset_metrics(step="test", logger=True)
 
+    def predict_step(self, batch, batch_idx: int) -> Tensor:
+
+        # Reduced precision (`inference_dtype`) is only applied for prediction
+        return self.model.predict(
+            x=batch.x,
+            edge_index=batch.edge_index,
+            edge_attr=batch.edge_attr,
+            batch=batch.batch
+        )
+
     def _calculate_loss_and_metrics(
         self,
         preds: Tensor,
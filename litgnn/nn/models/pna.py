@@ -1,3 +1,9 @@
+import os
+import os.path as osp
+import tempfile
+from typing import Optional
+
+import torch
 from torch import Tensor
 from torch_geometric.nn import PNA as _PyG_PNA
 from torch_geometric.nn import PNAConv
@@ -8,9 +14,23 @@ class PNA(_PyG_PNA):
     deg: Tensor = None
 
     @classmethod
-    def compute_degree(cls, dataloader) -> None:
+    def compute_degree(cls, dataloader, cache_path: Optional[str] = None) -> None:
+
+        if cache_path is not None and osp.exists(cache_path):
+            cls.deg = torch.load(cache_path)
+            return
 
         cls.deg = PNAConv.get_degree_histogram(dataloader)
+        if cache_path is not None:
+            # Write to a temp file first so that concurrent workers never load a partially written cache
+            fd, tmp_path = tempfile.mkstemp(dir=osp.dirname(cache_path), suffix=".tmp")
+            os.close(fd)
+            try:
+                torch.save(cls.deg, tmp_path)
+                os.replace(tmp_path, cache_path)
+            finally:
+                if osp.exists(tmp_path):
+                    os.unlink(tmp_path)
 
     def __init__(self, **kwargs) -> None:
 
@@ -1,4 +1,7 @@
+import hashlib
 import logging
+import os
+import os.path as osp
 import time
 from typing import Callable
 
@@ -28,7 +31,14 @@ def pre_init_model_setup(model_config: DictConfig, data_module: LitDataModule) -
     if model_cls == "PNA":
         if data_module._splits is None:
             data_module.setup()
+        # The degree histogram only depends on the training graphs, so it is cached next to the
+        # processed dataset and keyed by the training split indices and the processed file state
+        train_dataset = data_module._splits["train"]
+        stat = os.stat(train_dataset.processed_paths[0])
+        key = f"{list(train_dataset.indices())}-{stat.st_mtime_ns}-{stat.st_size}"
+        fingerprint = hashlib.md5(key.encode()).hexdigest()
+        cache_path = osp.join(train_dataset.processed_dir, f"pna_deg_{fingerprint}.pt")
         cls = getattr(models, model_cls)
-        cls.compute_degree(dataloader=data_module.train_dataloader())
+        cls.compute_degree(dataloader=data_module.train_dataloader(), cache_path=cache_path)
 
     return None
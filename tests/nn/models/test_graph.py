@@ -0,0 +1,80 @@
+import pytest
+import torch
+import torch.nn as nn
+
+from litgnn.nn.models.graph import GraphLevelGNN
+
+
+def get_model(**kwargs) -> GraphLevelGNN:
+
+    torch.manual_seed(0)
+    return GraphLevelGNN(
+        model_cls="AttentiveFP",
+        in_channels=4,
+        hidden_channels=8,
+        out_channels=2,
+        edge_dim=3,
+        num_conv_layers=2,
+        num_ffn_layers=2,
+        num_timesteps=2,
+        **kwargs
+    )
+
+
+def get_inputs() -> dict:
+
+    torch.manual_seed(0)
+    return dict(
+        x=torch.randn(5, 4),
+        edge_index=torch.tensor([[0, 1, 1, 2, 3, 4], [1, 0, 2, 1, 4, 3]]),
+        edge_attr=torch.randn(6, 3),
+        batch=torch.tensor([0, 0, 0, 1, 1]),
+    )
+
+
+@pytest.mark.parametrize("inference_dtype", ("int8", "float64", "bool", "qint8"))
+def test_invalid_inference_dtype(inference_dtype) -> None:
+
+    with pytest.raises(AssertionError):
+        get_model(inference_dtype=inference_dtype)
+
+
+def test_predict_autocast() -> None:
+
+    model = get_model(inference_dtype="bfloat16").eval()
+    inputs = get_inputs()
+
+    # `forward` (used for train/val/test) is unaffected by `inference_dtype`
+    with torch.no_grad():
+        out = model(**inputs)
+    assert out.dtype == torch.float32 and out.shape == (2, 2)
+
+    preds = model.predict(**inputs)
+    assert preds.dtype == torch.float32 and preds.shape == (2, 2)
+    assert not torch.equal(preds, out)
+    assert torch.allclose(preds, out, atol=1e-1)
+
+    model.inference_dtype = torch.float32
+    assert torch.equal(model.predict(**inputs), out)
+
+
+def test_predict_float16_on_cpu() -> None:
+
+    model = get_model(inference_dtype="float16").eval()
+    with pytest.raises(AssertionError):
+        model.predict(**get_inputs())
+
+
+def test_quantize_for_cpu() -> None:
+
+    model = get_model(inference_dtype="bfloat16").eval()
+    quantized = model.quantize_for_cpu()
+
+    assert quantized.inference_dtype == torch.float32
+    assert model.inference_dtype == torch.bfloat16 # Original model is left untouched
+    assert isinstance(quantized.seq_out[1], torch.ao.nn.quantized.dynamic.Linear)
+    assert type(quantized.model.gru) is nn.GRUCell
+    assert type(quantized.model.mol_gru) is nn.GRUCell
+
+    preds = quantized.predict(**get_inputs())
+    assert preds.dtype == torch.float32 and preds.shape == (2, 2)
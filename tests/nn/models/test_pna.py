@@ -0,0 +1,25 @@
+import torch
+from torch_geometric.data import Data
+from torch_geometric.loader import DataLoader
+
+from litgnn.nn.models import PNA
+
+
+def test_compute_degree_cache(tmp_path, monkeypatch) -> None:
+
+    monkeypatch.setattr(PNA, "deg", None)
+    data_list = [
+        Data(x=torch.randn(3, 4), edge_index=torch.tensor([[0, 1, 1, 2], [1, 0, 2, 1]])),
+        Data(x=torch.randn(2, 4), edge_index=torch.tensor([[0, 1], [1, 0]])),
+    ]
+    cache_path = str(tmp_path / "deg.pt")
+
+    PNA.compute_degree(DataLoader(data_list, batch_size=2), cache_path=cache_path)
+    expected = PNA.deg
+    assert torch.equal(expected, torch.tensor([0, 4, 1]))
+    assert [p.name for p in tmp_path.iterdir()] == ["deg.pt"] # No leftover temp files
+
+    # A cache hit must not iterate the dataloader
+    monkeypatch.setattr(PNA, "deg", None)
+    PNA.compute_degree(dataloader=None, cache_path=cache_path)
+    assert torch.equal(PNA.deg, expected)
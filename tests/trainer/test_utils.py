@@ -0,0 +1,83 @@
+import os
+
+import torch
+from omegaconf import DictConfig
+from torch_geometric.data import Data, InMemoryDataset
+
+from litgnn.data.data_module import LitDataModule
+from litgnn.nn.models import PNA
+from litgnn.nn.models import pna as pna_module
+from litgnn.trainer.utils import pre_init_model_setup
+
+
+class ToyDataset(InMemoryDataset):
+
+    def __init__(self, root: str) -> None:
+
+        super().__init__(root)
+        self.load(self.processed_paths[0])
+
+    @property
+    def raw_file_names(self) -> list:
+
+        return []
+
+    @property
+    def processed_file_names(self) -> str:
+
+        return "data.pt"
+
+    def download(self) -> None:
+
+        pass
+
+    def process(self) -> None:
+
+        data_list = [
+            Data(x=torch.randn(3, 4), edge_index=torch.tensor([[0, 1, 1, 2], [1, 0, 2, 1]])),
+            Data(x=torch.randn(2, 4), edge_index=torch.tensor([[0, 1], [1, 0]])),
+            Data(x=torch.randn(2, 4), edge_index=torch.tensor([[0, 1], [1, 0]])),
+        ]
+        self.save(data_list, self.processed_paths[0])
+
+
+def test_pna_degree_cache_invalidation(tmp_path, monkeypatch) -> None:
+
+    monkeypatch.setattr(PNA, "deg", None)
+    get_degree_histogram = pna_module.PNAConv.get_degree_histogram
+    calls = []
+
+    def counting_get_degree_histogram(loader):
+        calls.append(loader)
+        return get_degree_histogram(loader)
+
+    monkeypatch.setattr(pna_module.PNAConv, "get_degree_histogram", staticmethod(counting_get_degree_histogram))
+
+    dataset = ToyDataset(str(tmp_path))
+    data_module = LitDataModule(dataset_config={}, split="random_split", split_sizes=[0.6, 0.2, 0.2], batch_size=2)
+    data_module._dataset = dataset
+    data_module._splits = dict(
+        train=dataset.index_select([0, 1]),
+        val=dataset.index_select([2]),
+        test=dataset.index_select([2]),
+    )
+    model_config = DictConfig(dict(model_cls="PNA"))
+    get_cache_files = lambda: sorted(p for p in os.listdir(dataset.processed_dir) if p.startswith("pna_deg_"))
+
+    pre_init_model_setup(model_config=model_config, data_module=data_module)
+    pre_init_model_setup(model_config=model_config, data_module=data_module)
+    assert len(calls) == 1
+    assert len(get_cache_files()) == 1
+
+    # Re-processed data must not reuse the stale histogram
+    stat = os.stat(dataset.processed_paths[0])
+    os.utime(dataset.processed_paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    pre_init_model_setup(model_config=model_config, data_module=data_module)
+    assert len(calls) == 2
+    assert len(get_cache_files()) == 2
+
+    # A different training split gets its own cache entry
+    data_module._splits["train"] = dataset.index_select([0, 2])
+    pre_init_model_setup(model_config=model_config, data_module=data_module)
+    assert len(calls) == 3
+    assert len(get_cache_files()) == 3